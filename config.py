@@ -0,0 +1,54 @@
+# Database connection settings, shared by the API and test_connection.py.
+# Kept free of app imports so the connectivity check stays lightweight.
+
+import os
+import ssl
+import certifi
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Database configuration
+class DatabaseConfig:
+    """Database configuration from environment variables"""
+    def __init__(self):
+        self.host = os.getenv("DB_HOST", "tanner-postgres.ct04w2k200ji.us-east-2.rds.amazonaws.com")
+        self.port = os.getenv("DB_PORT", "5432")
+        self.database = os.getenv("DB_NAME", "resume_db")
+        self.username = os.getenv("DB_USERNAME")
+        self.password = os.getenv("DB_PASSWORD")
+        # Set when DB_HOST/DB_PORT point at PgBouncer in transaction pooling mode
+        self.use_pgbouncer = os.getenv("DB_PGBOUNCER", "").lower() in ("1", "true", "yes")
+        # TLS mode as in libpq: disable, require (encrypt only) or verify-full
+        self.ssl_mode = os.getenv("DB_SSLMODE", "require")
+        self.ssl_ca = os.getenv("DB_SSL_CA")
+        
+        if not self.username or not self.password:
+            raise ValueError("DB_USERNAME and DB_PASSWORD must be set in environment variables")
+        if self.ssl_mode not in ("disable", "require", "verify-full"):
+            raise ValueError("DB_SSLMODE must be one of disable, require, verify-full")
+        
+        # Built once and shared by every connection, so handshakes don't
+        # rebuild a context and reload CA certificates each time
+        self.ssl = self._build_ssl_context()
+    
+    def _build_ssl_context(self):
+        """Return the asyncpg `ssl` argument: an SSLContext, or False for no TLS"""
+        if self.ssl_mode == "disable":
+            return False
+        
+        if self.ssl_mode == "verify-full":
+            # Managed databases may need their provider's CA bundle (DB_SSL_CA)
+            context = ssl.create_default_context(cafile=self.ssl_ca or certifi.where())
+            context.check_hostname = True
+            return context
+        
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return context
+    
+    @property
+    def url(self) -> str:
+        return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
@@ -1,106 +1,351 @@
 # GraphQL Resume API with FastAPI + Strawberry
 # Simple implementation for Users, Education, and Job Experience
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 import strawberry
 from strawberry.fastapi import GraphQLRouter
 from strawberry.types import Info
 from strawberry.scalars import JSON
-from typing import Optional, List
+from strawberry.types.nodes import SelectedField
+from strawberry.utils.str_converters import to_camel_case
+from typing import Any, Optional, List
+from collections import defaultdict
 from datetime import datetime, date
-from decimal import Decimal
 import uuid
 import asyncio
+import msgspec
+import orjson
+from contextlib import asynccontextmanager
+from aiodataloader import DataLoader
 
 # Database imports
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy import Column, String, Text, DateTime, Date, Numeric, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import declarative_base, relationship, selectinload
+from sqlalchemy import Column, String, Text, DateTime, Date, Numeric, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.future import select
-from sqlalchemy import and_
+from sqlalchemy import and_, any_, bindparam, insert, event, inspect, text
 import os
-from dotenv import load_dotenv
 
 # Pydantic for validation
 from pydantic import BaseModel, EmailStr, Field
 
-# Load environment variables
-load_dotenv()
-
-# Database configuration
-class DatabaseConfig:
-    """Database configuration from environment variables"""
-    def __init__(self):
-        self.host = os.getenv("DB_HOST", "tanner-postgres.ct04w2k200ji.us-east-2.rds.amazonaws.com")
-        self.port = os.getenv("DB_PORT", "5432")
-        self.database = os.getenv("DB_NAME", "resume_db")
-        self.username = os.getenv("DB_USERNAME")
-        self.password = os.getenv("DB_PASSWORD")
-        
-        if not self.username or not self.password:
-            raise ValueError("DB_USERNAME and DB_PASSWORD must be set in environment variables")
-    
-    @property
-    def url(self) -> str:
-        return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+# Database configuration (loads .env)
+from config import DatabaseConfig
 
 # Database setup
+# The engine and its connection pool are created once in the app lifespan
+# (see below) and shared by every request through app.state.
 db_config = DatabaseConfig()
-engine = create_async_engine(db_config.url, echo=True)
-SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Each worker process opens up to DB_POOL_MAX_SIZE connections, so the server
+# total is WEB_CONCURRENCY * DB_POOL_MAX_SIZE and must stay below the
+# database's max_connections
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "20"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "30"))
+if DB_POOL_MAX_SIZE < DB_POOL_MIN_SIZE:
+    # A negative max_overflow would lift QueuePool's limit entirely
+    raise ValueError("DB_POOL_MAX_SIZE must be at least DB_POOL_MIN_SIZE")
+# Rows fetched per round trip when streaming large list results
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+# SQL statement logging is expensive; only enable it for local debugging
+SQL_ECHO = os.getenv("SQL_ECHO", "").lower() in ("1", "true", "yes")
 Base = declarative_base()
 
+def json_serializer(value) -> str:
+    """Encode JSONB values with orjson (SQLAlchemy expects str, not bytes)"""
+    return orjson.dumps(value).decode()
+
+def build_engine():
+    """Create the async engine, pooling in-process unless PgBouncer does it"""
+    if db_config.use_pgbouncer:
+        # PgBouncer hands each transaction to whichever server connection is
+        # free, so keep no local pool and no session-level prepared statements
+        engine = create_async_engine(
+            db_config.url,
+            echo=SQL_ECHO,
+            json_serializer=json_serializer,
+            json_deserializer=orjson.loads,
+            isolation_level="READ COMMITTED",
+            poolclass=NullPool,
+            # No server_settings here: PgBouncer refuses startup parameters it
+            # doesn't track, such as jit. Turn jit off on the database instead
+            # (ALTER DATABASE resume_db SET jit = off).
+            connect_args={
+                "ssl": db_config.ssl,
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            },
+        )
+    else:
+        engine = create_async_engine(
+            db_config.url,
+            echo=SQL_ECHO,
+            json_serializer=json_serializer,
+            json_deserializer=orjson.loads,
+            isolation_level="READ COMMITTED",
+            pool_size=DB_POOL_MIN_SIZE,
+            max_overflow=DB_POOL_MAX_SIZE - DB_POOL_MIN_SIZE,
+            pool_timeout=30,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            pool_use_lifo=True,
+            connect_args={
+                "ssl": db_config.ssl,
+                "server_settings": {"jit": "off"},
+                # Keep prepared statements for every query shape on each pooled
+                # connection so repeated queries skip the parse/plan step
+                "prepared_statement_cache_size": 2048,
+                "statement_cache_size": 2048,
+                "max_cached_statement_lifetime": 0,
+            },
+        )
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def use_text_uuids(dbapi_connection, connection_record):
+        # Have asyncpg hand back UUIDs as plain strings rather than
+        # building uuid.UUID objects the API would only stringify again
+        dbapi_connection.run_async(
+            lambda conn: conn.set_type_codec(
+                "uuid", encoder=str, decoder=str, schema="pg_catalog", format="text"
+            )
+        )
+    
+    return engine
+
 # Database Models
 class UserModel(Base):
     __tablename__ = "users"
     
-    user_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String(255), unique=True, nullable=False)
     full_name = Column(String(255))
     password_hash = Column(String(255), nullable=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    
+    # Never lazy-load; callers opt into selectin loading per query (see
+    # user_children_options) so plain user lookups don't fetch children
+    education = relationship("EducationModel", lazy="raise")
+    job_experience = relationship("JobExperienceModel", lazy="raise")
 
 class EducationModel(Base):
     __tablename__ = "education"
+    # Backs every per-user education lookup (see init-schema.sql)
+    __table_args__ = (Index("idx_education_user_id", "user_id"),)
     
-    education_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False)
+    education_id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.user_id"), nullable=False)
     institution_name = Column(String(255), nullable=False)
     location = Column(String(255))
     date_started = Column(Date, nullable=False)
     date_finished = Column(Date)
     major = Column(String(255))
     minor = Column(String(255))
-    gpa = Column(Numeric(3, 2))
-    details = Column(JSONB)
+    # Decoded straight to float; the API never exposes Decimal
+    gpa = Column(Numeric(3, 2, asdecimal=False))
+    details = Column(JSONB(none_as_null=True))
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
 class JobExperienceModel(Base):
     __tablename__ = "job_experience"
+    # Backs every per-user job experience lookup (see init-schema.sql)
+    __table_args__ = (Index("idx_job_experience_user_id", "user_id"),)
     
-    job_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False)
+    job_id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(UUID(as_uuid=False), ForeignKey("users.user_id"), nullable=False)
     company_name = Column(String(255), nullable=False)
     job_title = Column(String(255))
     location = Column(String(255))
     date_started = Column(Date, nullable=False)
     date_left = Column(Date)
-    details = Column(JSONB)
+    details = Column(JSONB(none_as_null=True))
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
 # Database dependency
-async def get_db():
-    async with SessionLocal() as session:
+async def get_db(request: Request):
+    async with request.app.state.session_factory() as session:
         try:
             yield session
         finally:
             await session.close()
 
+# DataLoaders (one instance per request, see get_context)
+def matches_any(column, ids):
+    """Build `column = ANY($1)` with a single array parameter.
+
+    Unlike IN (...), the SQL text doesn't change with the number of IDs, so
+    every batch reuses the same cached prepared statement.
+    """
+    return column == any_(bindparam("ids", list(ids), type_=ARRAY(UUID(as_uuid=False))))
+
+class UserLoader(DataLoader):
+    """Batch user lookups by ID into a single query"""
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        super().__init__()
+        self.session = session
+        self.lock = lock
+
+    async def batch_load_fn(self, user_ids):
+        async with self.lock:
+            result = await self.session.execute(
+                select(UserModel).where(matches_any(UserModel.user_id, user_ids))
+            )
+        users_by_id = {user.user_id: user for user in result.scalars().all()}
+        return [users_by_id.get(user_id) for user_id in user_ids]
+
+class EducationByUserLoader(DataLoader):
+    """Batch education lookups for many users into a single query"""
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        super().__init__()
+        self.session = session
+        self.lock = lock
+
+    async def batch_load_fn(self, user_ids):
+        async with self.lock:
+            result = await self.session.execute(
+                select(EducationModel).where(matches_any(EducationModel.user_id, user_ids))
+            )
+        records_by_user = defaultdict(list)
+        for edu in result.scalars().all():
+            records_by_user[edu.user_id].append(edu)
+        return [records_by_user[user_id] for user_id in user_ids]
+
+class JobExperienceByUserLoader(DataLoader):
+    """Batch job experience lookups for many users into a single query"""
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        super().__init__()
+        self.session = session
+        self.lock = lock
+
+    async def batch_load_fn(self, user_ids):
+        async with self.lock:
+            result = await self.session.execute(
+                select(JobExperienceModel).where(matches_any(JobExperienceModel.user_id, user_ids))
+            )
+        records_by_user = defaultdict(list)
+        for job in result.scalars().all():
+            records_by_user[job.user_id].append(job)
+        return [records_by_user[user_id] for user_id in user_ids]
+
+# Column projection
+def selected_fields(info: Info) -> set:
+    """Return the GraphQL names of the fields selected below the current field"""
+    requested = set()
+    pending = list(info.selected_fields)
+    while pending:
+        for selection in pending.pop().selections:
+            if isinstance(selection, SelectedField):
+                requested.add(selection.name)
+            else:
+                # Fragment spreads and inline fragments carry their own selections
+                pending.append(selection)
+    return requested
+
+def selected_columns(info: Info, model, always=()) -> list:
+    """Return the columns of `model` requested by the current selection set.
+
+    Columns named in `always` are included regardless, e.g. keys that nested
+    resolvers need to load related records.
+    """
+    requested = selected_fields(info)
+    return [
+        column for column in model.__table__.columns
+        if column.key in always or to_camel_case(column.key) in requested
+    ]
+
+def user_children_options(info: Info) -> list:
+    """Return selectinload options for the User children in the selection set.
+
+    Each requested relationship costs one extra WHERE user_id IN (...) query
+    for the whole result, and avoids the row multiplication of a JOIN.
+    """
+    requested = selected_fields(info)
+    options = []
+    if "education" in requested:
+        options.append(selectinload(UserModel.education))
+    if "jobExperience" in requested:
+        options.append(selectinload(UserModel.job_experience))
+    return options
+
+# Users with both child lists aggregated per user, in a single round trip.
+# The lists are sent as JSON text and decoded by the msgspec decoders below.
+# to_jsonb() would render timestamps in the session TimeZone, so they are
+# rewritten as UTC to match what asyncpg returns on every other path.
+USERS_WITH_CHILDREN = text("""
+    WITH e AS (
+        SELECT user_id, jsonb_agg(to_jsonb(education) || jsonb_build_object(
+            'created_at', to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+            'updated_at', to_char(updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+        )) AS records
+        FROM education GROUP BY user_id
+    ), j AS (
+        SELECT user_id, jsonb_agg(to_jsonb(job_experience) || jsonb_build_object(
+            'created_at', to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'),
+            'updated_at', to_char(updated_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+        )) AS records
+        FROM job_experience GROUP BY user_id
+    )
+    SELECT u.user_id, u.email, u.full_name, u.created_at, u.updated_at,
+           COALESCE(e.records, '[]'::jsonb)::text AS education,
+           COALESCE(j.records, '[]'::jsonb)::text AS job_experience
+    FROM users u
+    LEFT JOIN e USING (user_id)
+    LEFT JOIN j USING (user_id)
+""")
+
+# C-level record types for the aggregated JSON. msgspec parses straight into
+# these, including the ISO date/timestamp strings, with no per-row Python loop.
+class EducationRecord(msgspec.Struct, gc=False):
+    education_id: str
+    user_id: str
+    institution_name: str
+    location: Optional[str]
+    date_started: date
+    date_finished: Optional[date]
+    major: Optional[str]
+    minor: Optional[str]
+    gpa: Optional[float]
+    details: Any
+    created_at: datetime
+    updated_at: datetime
+
+class JobExperienceRecord(msgspec.Struct, gc=False):
+    job_id: str
+    user_id: str
+    company_name: str
+    job_title: Optional[str]
+    location: Optional[str]
+    date_started: date
+    date_left: Optional[date]
+    details: Any
+    created_at: datetime
+    updated_at: datetime
+
+decode_education_records = msgspec.json.Decoder(List[EducationRecord]).decode
+decode_job_experience_records = msgspec.json.Decoder(List[JobExperienceRecord]).decode
+
+async def stream_rows(info: Info, stmt):
+    """Yield the rows of `stmt` from a server-side cursor.
+
+    graphql-core completes list fields from async iterables, so rows are
+    fetched STREAM_BATCH_SIZE at a time instead of buffering the whole
+    result first, and the event loop gets a turn between batches. asyncpg
+    can't run other queries on a connection while a cursor on it is being
+    read, so the request's db_lock is held until the cursor is exhausted.
+    Nested resolvers only run once graphql-core has drained the iterator.
+    """
+    async with info.context["db_lock"]:
+        result = await info.context["db_session"].stream(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for row in result:
+            yield row
+
 # GraphQL Types
 @strawberry.type
 class User:
@@ -109,58 +354,53 @@ class User:
     full_name: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+    # Child records eager-loaded by the parent query, if any
+    preloaded_education: strawberry.Private[Optional[list]] = None
+    preloaded_job_experience: strawberry.Private[Optional[list]] = None
     
+    @classmethod
+    def from_row(cls, row) -> "User":
+        """Build a User from the full row a create mutation returns"""
+        values = row._mapping
+        return cls(
+            user_id=values["user_id"],
+            email=values["email"],
+            full_name=values["full_name"],
+            created_at=values["created_at"],
+            updated_at=values["updated_at"],
+        )
+    
+    @classmethod
+    def from_model(cls, user: UserModel) -> "User":
+        """Build a User from a UserModel, keeping any eager-loaded children"""
+        unloaded = inspect(user).unloaded
+        return cls(
+            user_id=user.user_id,
+            email=user.email,
+            full_name=user.full_name,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            preloaded_education=None if "education" in unloaded else user.education,
+            preloaded_job_experience=None if "job_experience" in unloaded else user.job_experience,
+        )
+    
+    # The child resolvers return the loaded records (ORM models or msgspec
+    # structs) as-is: their attributes already match the Education and
+    # JobExperience fields, which strawberry reads with getattr, so no
+    # per-record wrapper objects are built.
     @strawberry.field
     async def education(self, info: Info) -> List["Education"]:
         """Get all education records for this user"""
-        session = info.context["db_session"]
-        result = await session.execute(
-            select(EducationModel).where(EducationModel.user_id == self.user_id)
-        )
-        education_records = result.scalars().all()
-        
-        return [
-            Education(
-                education_id=str(edu.education_id),
-                user_id=str(edu.user_id),
-                institution_name=edu.institution_name,
-                location=edu.location,
-                date_started=edu.date_started,
-                date_finished=edu.date_finished,
-                major=edu.major,
-                minor=edu.minor,
-                gpa=float(edu.gpa) if edu.gpa else None,
-                details=edu.details,
-                created_at=edu.created_at,
-                updated_at=edu.updated_at,
-            )
-            for edu in education_records
-        ]
+        if self.preloaded_education is not None:
+            return self.preloaded_education
+        return await info.context["education_loader"].load(self.user_id)
     
     @strawberry.field
     async def job_experience(self, info: Info) -> List["JobExperience"]:
         """Get all job experience records for this user"""
-        session = info.context["db_session"]
-        result = await session.execute(
-            select(JobExperienceModel).where(JobExperienceModel.user_id == self.user_id)
-        )
-        job_records = result.scalars().all()
-        
-        return [
-            JobExperience(
-                job_id=str(job.job_id),
-                user_id=str(job.user_id),
-                company_name=job.company_name,
-                job_title=job.job_title,
-                location=job.location,
-                date_started=job.date_started,
-                date_left=job.date_left,
-                details=job.details,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-            )
-            for job in job_records
-        ]
+        if self.preloaded_job_experience is not None:
+            return self.preloaded_job_experience
+        return await info.context["job_experience_loader"].load(self.user_id)
 
 @strawberry.type
 class Education:
@@ -177,23 +417,32 @@ class Education:
     created_at: datetime
     updated_at: datetime
     
+    @classmethod
+    def from_row(cls, row) -> "Education":
+        """Build an Education from the full row a create mutation returns"""
+        values = row._mapping
+        return cls(
+            education_id=values["education_id"],
+            user_id=values["user_id"],
+            institution_name=values["institution_name"],
+            location=values["location"],
+            date_started=values["date_started"],
+            date_finished=values["date_finished"],
+            major=values["major"],
+            minor=values["minor"],
+            gpa=values["gpa"],
+            details=values["details"],
+            created_at=values["created_at"],
+            updated_at=values["updated_at"],
+        )
+    
     @strawberry.field
     async def user(self, info: Info) -> Optional[User]:
         """Get the user who owns this education record"""
-        session = info.context["db_session"]
-        result = await session.execute(
-            select(UserModel).where(UserModel.user_id == self.user_id)
-        )
-        user_model = result.scalar_one_or_none()
+        user_model = await info.context["user_loader"].load(self.user_id)
         
         if user_model:
-            return User(
-                user_id=str(user_model.user_id),
-                email=user_model.email,
-                full_name=user_model.full_name,
-                created_at=user_model.created_at,
-                updated_at=user_model.updated_at,
-            )
+            return User.from_model(user_model)
         return None
 
 @strawberry.type
@@ -209,23 +458,30 @@ class JobExperience:
     created_at: datetime
     updated_at: datetime
     
+    @classmethod
+    def from_row(cls, row) -> "JobExperience":
+        """Build a JobExperience from the full row a create mutation returns"""
+        values = row._mapping
+        return cls(
+            job_id=values["job_id"],
+            user_id=values["user_id"],
+            company_name=values["company_name"],
+            job_title=values["job_title"],
+            location=values["location"],
+            date_started=values["date_started"],
+            date_left=values["date_left"],
+            details=values["details"],
+            created_at=values["created_at"],
+            updated_at=values["updated_at"],
+        )
+    
     @strawberry.field
     async def user(self, info: Info) -> Optional[User]:
         """Get the user who owns this job experience record"""
-        session = info.context["db_session"]
-        result = await session.execute(
-            select(UserModel).where(UserModel.user_id == self.user_id)
-        )
-        user_model = result.scalar_one_or_none()
+        user_model = await info.context["user_loader"].load(self.user_id)
         
         if user_model:
-            return User(
-                user_id=str(user_model.user_id),
-                email=user_model.email,
-                full_name=user_model.full_name,
-                created_at=user_model.created_at,
-                updated_at=user_model.updated_at,
-            )
+            return User.from_model(user_model)
         return None
 
 # Input Types for Mutations
@@ -308,100 +564,83 @@ class Query:
     async def users(self, info: Info) -> List[User]:
         """Get all users"""
         session = info.context["db_session"]
-        result = await session.execute(select(UserModel))
-        users = result.scalars().all()
+        requested = selected_fields(info)
         
-        return [
-            User(
-                user_id=str(user.user_id),
-                email=user.email,
-                full_name=user.full_name,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
-            for user in users
-        ]
+        if "education" in requested and "jobExperience" in requested:
+            async with info.context["db_lock"]:
+                result = await session.execute(USERS_WITH_CHILDREN)
+            return [
+                User(
+                    user_id=row.user_id,
+                    email=row.email,
+                    full_name=row.full_name,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                    preloaded_education=decode_education_records(row.education),
+                    preloaded_job_experience=decode_job_experience_records(row.job_experience),
+                )
+                for row in result
+            ]
+        
+        options = user_children_options(info)
+        
+        if not options:
+            # No child fields were selected, so none of User's resolvers run
+            # and the projected rows can be streamed without wrapping them
+            columns = selected_columns(info, UserModel, always=("user_id",))
+            return stream_rows(info, select(*columns))
+        
+        async with info.context["db_lock"]:
+            result = await session.execute(select(UserModel).options(*options))
+        return [User.from_model(user) for user in result.scalars().all()]
     
     @strawberry.field
     async def user(self, info: Info, user_id: str) -> Optional[User]:
         """Get a specific user by ID"""
         session = info.context["db_session"]
-        result = await session.execute(
-            select(UserModel).where(UserModel.user_id == user_id)
-        )
+        options = user_children_options(info)
+        
+        if not options:
+            columns = selected_columns(info, UserModel, always=("user_id",))
+            async with info.context["db_lock"]:
+                result = await session.execute(
+                    select(*columns).where(UserModel.user_id == user_id)
+                )
+            return result.one_or_none()
+        
+        async with info.context["db_lock"]:
+            result = await session.execute(
+                select(UserModel).where(UserModel.user_id == user_id).options(*options)
+            )
         user = result.scalar_one_or_none()
         
         if user:
-            return User(
-                user_id=str(user.user_id),
-                email=user.email,
-                full_name=user.full_name,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
+            return User.from_model(user)
         return None
     
     @strawberry.field
     async def education_records(self, info: Info, user_id: Optional[str] = None) -> List[Education]:
         """Get education records, optionally filtered by user"""
-        session = info.context["db_session"]
+        columns = selected_columns(info, EducationModel, always=("education_id", "user_id"))
         
+        stmt = select(*columns)
         if user_id:
-            result = await session.execute(
-                select(EducationModel).where(EducationModel.user_id == user_id)
-            )
-        else:
-            result = await session.execute(select(EducationModel))
+            stmt = stmt.where(EducationModel.user_id == user_id)
         
-        education_records = result.scalars().all()
-        
-        return [
-            Education(
-                education_id=str(edu.education_id),
-                user_id=str(edu.user_id),
-                institution_name=edu.institution_name,
-                location=edu.location,
-                date_started=edu.date_started,
-                date_finished=edu.date_finished,
-                major=edu.major,
-                minor=edu.minor,
-                gpa=float(edu.gpa) if edu.gpa else None,
-                details=edu.details,
-                created_at=edu.created_at,
-                updated_at=edu.updated_at,
-            )
-            for edu in education_records
-        ]
+        # Rows carry the selected fields as attributes; return them unwrapped
+        return stream_rows(info, stmt)
     
     @strawberry.field
     async def job_experiences(self, info: Info, user_id: Optional[str] = None) -> List[JobExperience]:
         """Get job experiences, optionally filtered by user"""
-        session = info.context["db_session"]
+        columns = selected_columns(info, JobExperienceModel, always=("job_id", "user_id"))
         
+        stmt = select(*columns)
         if user_id:
-            result = await session.execute(
-                select(JobExperienceModel).where(JobExperienceModel.user_id == user_id)
-            )
-        else:
-            result = await session.execute(select(JobExperienceModel))
-        
-        job_records = result.scalars().all()
+            stmt = stmt.where(JobExperienceModel.user_id == user_id)
         
-        return [
-            JobExperience(
-                job_id=str(job.job_id),
-                user_id=str(job.user_id),
-                company_name=job.company_name,
-                job_title=job.job_title,
-                location=job.location,
-                date_started=job.date_started,
-                date_left=job.date_left,
-                details=job.details,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-            )
-            for job in job_records
-        ]
+        # Rows carry the selected fields as attributes; return them unwrapped
+        return stream_rows(info, stmt)
 
 # GraphQL Mutations
 @strawberry.type
@@ -415,26 +654,29 @@ class Mutation:
             # Simple password hashing (use proper hashing in production)
             password_hash = f"hashed_{input.password}"
             
-            new_user = UserModel(
-                email=input.email,
-                full_name=input.full_name,
-                password_hash=password_hash
+            # RETURNING hands back the generated values without a second SELECT
+            result = await session.execute(
+                insert(UserModel)
+                .values(
+                    email=input.email,
+                    full_name=input.full_name,
+                    password_hash=password_hash
+                )
+                .returning(
+                    UserModel.user_id,
+                    UserModel.email,
+                    UserModel.full_name,
+                    UserModel.created_at,
+                    UserModel.updated_at,
+                )
             )
-            
-            session.add(new_user)
+            row = result.one()
             await session.commit()
-            await session.refresh(new_user)
             
             return CreateUserResponse(
                 success=True,
                 message="User created successfully",
-                user=User(
-                    user_id=str(new_user.user_id),
-                    email=new_user.email,
-                    full_name=new_user.full_name,
-                    created_at=new_user.created_at,
-                    updated_at=new_user.updated_at,
-                )
+                user=User.from_row(row)
             )
         
         except Exception as e:
@@ -450,39 +692,28 @@ class Mutation:
         session = info.context["db_session"]
         
         try:
-            new_education = EducationModel(
-                user_id=input.user_id,
-                institution_name=input.institution_name,
-                location=input.location,
-                date_started=input.date_started,
-                date_finished=input.date_finished,
-                major=input.major,
-                minor=input.minor,
-                gpa=Decimal(str(input.gpa)) if input.gpa else None,
-                details=input.details
+            result = await session.execute(
+                insert(EducationModel)
+                .values(
+                    user_id=input.user_id,
+                    institution_name=input.institution_name,
+                    location=input.location,
+                    date_started=input.date_started,
+                    date_finished=input.date_finished,
+                    major=input.major,
+                    minor=input.minor,
+                    gpa=input.gpa,
+                    details=input.details
+                )
+                .returning(*EducationModel.__table__.columns)
             )
-            
-            session.add(new_education)
+            row = result.one()
             await session.commit()
-            await session.refresh(new_education)
             
             return CreateEducationResponse(
                 success=True,
                 message="Education record created successfully",
-                education=Education(
-                    education_id=str(new_education.education_id),
-                    user_id=str(new_education.user_id),
-                    institution_name=new_education.institution_name,
-                    location=new_education.location,
-                    date_started=new_education.date_started,
-                    date_finished=new_education.date_finished,
-                    major=new_education.major,
-                    minor=new_education.minor,
-                    gpa=float(new_education.gpa) if new_education.gpa else None,
-                    details=new_education.details,
-                    created_at=new_education.created_at,
-                    updated_at=new_education.updated_at,
-                )
+                education=Education.from_row(row)
             )
         
         except Exception as e:
@@ -498,35 +729,26 @@ class Mutation:
         session = info.context["db_session"]
         
         try:
-            new_job = JobExperienceModel(
-                user_id=input.user_id,
-                company_name=input.company_name,
-                job_title=input.job_title,
-                location=input.location,
-                date_started=input.date_started,
-                date_left=input.date_left,
-                details=input.details
+            result = await session.execute(
+                insert(JobExperienceModel)
+                .values(
+                    user_id=input.user_id,
+                    company_name=input.company_name,
+                    job_title=input.job_title,
+                    location=input.location,
+                    date_started=input.date_started,
+                    date_left=input.date_left,
+                    details=input.details
+                )
+                .returning(*JobExperienceModel.__table__.columns)
             )
-            
-            session.add(new_job)
+            row = result.one()
             await session.commit()
-            await session.refresh(new_job)
             
             return CreateJobExperienceResponse(
                 success=True,
                 message="Job experience created successfully",
-                job_experience=JobExperience(
-                    job_id=str(new_job.job_id),
-                    user_id=str(new_job.user_id),
-                    company_name=new_job.company_name,
-                    job_title=new_job.job_title,
-                    location=new_job.location,
-                    date_started=new_job.date_started,
-                    date_left=new_job.date_left,
-                    details=new_job.details,
-                    created_at=new_job.created_at,
-                    updated_at=new_job.updated_at,
-                )
+                job_experience=JobExperience.from_row(row)
             )
         
         except Exception as e:
@@ -540,28 +762,75 @@ class Mutation:
 schema = strawberry.Schema(query=Query, mutation=Mutation)
 
 # Context provider for database session
-async def get_context():
-    async with SessionLocal() as session:
-        return {"db_session": session}
+async def get_context(session: AsyncSession = Depends(get_db)):
+    # get_db closes the session once the response is sent. Check out its
+    # connection now so concurrently running top-level resolvers all share
+    # it instead of racing to open one.
+    await session.connection()
+    # Each request uses exactly one pooled connection; resolvers take this
+    # lock around their queries so they don't interleave with a cursor read
+    lock = asyncio.Lock()
+    return {
+        "db_session": session,
+        "db_lock": lock,
+        "user_loader": UserLoader(session, lock),
+        "education_loader": EducationByUserLoader(session, lock),
+        "job_experience_loader": JobExperienceByUserLoader(session, lock),
+    }
+
+# Connection pool lifecycle
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared connection pool on startup and close it on shutdown"""
+    engine = build_engine()
+    
+    # Pre-warm the pool so the first requests don't pay for connection setup
+    if not db_config.use_pgbouncer:
+        connections = await asyncio.gather(
+            *(engine.connect().start() for _ in range(DB_POOL_MIN_SIZE))
+        )
+        await asyncio.gather(*(conn.close() for conn in connections))
+    
+    app.state.engine = engine
+    # Resolvers only read or insert through explicit statements, so there
+    # are never pending ORM changes worth flushing before each query
+    app.state.session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    try:
+        yield
+    finally:
+        await engine.dispose()
 
 # FastAPI setup
-app = FastAPI(title="Resume GraphQL API", version="1.0.0")
+app = FastAPI(title="Resume GraphQL API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware
+# Browser origins allowed to call the API, comma-separated
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
+# GraphQL router that serializes responses with orjson
+class ORJSONGraphQLRouter(GraphQLRouter):
+    def encode_json(self, data: object) -> bytes:
+        return orjson.dumps(data)
+
 # Add GraphQL endpoint
-graphql_app = GraphQLRouter(schema, context_getter=get_context)
+graphql_app = ORJSONGraphQLRouter(schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/graphql")
 
 @app.get("/")
-async def root():
+async def root() -> dict:
     return {
         "message": "Resume GraphQL API",
         "graphql_endpoint": "/graphql",
@@ -570,4 +839,12 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        # Each worker pre-warms its own pool; see DB_POOL_MIN_SIZE/MAX_SIZE
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
\ No newline at end of file
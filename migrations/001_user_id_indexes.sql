@@ -0,0 +1,13 @@
+-- ==========================
+-- Indexes on user_id for per-user lookups
+-- ==========================
+-- init-schema.sql creates these for new databases. Run this against
+-- databases built before they existed (e.g. from database_design.sql).
+-- CONCURRENTLY avoids locking writes while the index builds, but it cannot
+-- run inside a transaction block, so run it with psql autocommit (the default).
+--
+-- users.email needs nothing here: its UNIQUE constraint is already backed
+-- by a btree index (users_email_key).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_education_user_id ON education(user_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_experience_user_id ON job_experience(user_id);
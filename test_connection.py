@@ -1,20 +1,20 @@
 # test_connection.py
-import asyncio
 import asyncpg
-from dotenv import load_dotenv
-import os
+import uvloop
 
-load_dotenv()
+from config import DatabaseConfig
 
 async def test_connection():
     try:
+        # Same host, credentials and TLS settings the API connects with
+        config = DatabaseConfig()
         conn = await asyncpg.connect(
-            host=os.getenv("DB_HOST"),
-            port=int(os.getenv("DB_PORT", 5432)),
-            database=os.getenv("DB_NAME"),
-            user=os.getenv("DB_USERNAME"),
-            password=os.getenv("DB_PASSWORD"),
-            ssl="require"
+            host=config.host,
+            port=int(config.port),
+            database=config.database,
+            user=config.username,
+            password=config.password,
+            ssl=config.ssl
         )
         
         # Test query
@@ -27,4 +27,4 @@ async def test_connection():
         print(f"Connection failed: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(test_connection())
\ No newline at end of file
+    uvloop.run(test_connection())
\ No newline at end of file